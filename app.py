@@ -1,13 +1,20 @@
 import streamlit as st
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import random
 import threading
-import json
-from io import StringIO
-from datetime import datetime
-from streamlit_autorefresh import st_autorefresh
+import orjson
+import os
+import logging
+import queue
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO, StringIO
+from datetime import datetime, timedelta
 
 # =========================
 # Page & Styling
@@ -45,17 +52,29 @@ extended_break_chance = st.sidebar.slider("Extended Break Chance (%)", 0, 100, 1
 extended_break_min = st.sidebar.number_input("Extended Break Min (sec)", value=300, min_value=1)
 extended_break_max = st.sidebar.number_input("Extended Break Max (sec)", value=600, min_value=1)
 
+st.sidebar.subheader("Concurrency")
+max_workers = st.sidebar.number_input("Concurrent Launches", value=1, min_value=1, max_value=8,
+                                      help="Each slot runs its own delay, so N slots send ~N× as many actions.")
+
 st.sidebar.divider()
 st.sidebar.caption("Tip: Keep delays human-like to respect platform limits.")
 
 # =========================
 # Session State Init
 # =========================
+LOG_HISTORY = 2000  # log rows kept in memory; older rows are evicted
+
 def _init_state():
     ss = st.session_state
     ss.setdefault("df", None)
     ss.setdefault("processed_profiles", set())
-    ss.setdefault("logs", [])  # list of dicts for dataframe
+    ss.setdefault("uncompacted_profiles", 0)  # successes appended to the log since last snapshot
+    ss.setdefault("logs", deque(maxlen=LOG_HISTORY))  # dicts for dataframe
+    ss.setdefault("log_count", 0)  # total rows ever appended; keeps counting past evictions
+    ss.setdefault("log_version", 0)  # bumped on every log change; drives live reruns
+    ss.setdefault("logs_df", None)  # cached DataFrame of ss.logs for the live table
+    ss.setdefault("logs_df_count", 0)  # log_count already reflected in logs_df
+    ss.setdefault("logs_df_stale", False)  # set when a logged row is replaced in place
     ss.setdefault("is_running", False)
     ss.setdefault("is_paused", False)
     ss.setdefault("is_stopped", False)
@@ -64,34 +83,131 @@ def _init_state():
     ss.setdefault("completed", 0)
     ss.setdefault("total", 0)
     ss.setdefault("avg_secs", None)
+    ss.setdefault("elapsed_sum", 0.0)
+    ss.setdefault("elapsed_count", 0)
     ss.setdefault("lock", threading.Lock())
-    ss.setdefault("pause_event", threading.Event())
+    if "pause_event" not in ss:
+        # pause_event semantics: set() means RUNNING; clear() means PAUSED.
+        # Only set on creation, so a rerun doesn't silently resume a paused run.
+        ss.pause_event = threading.Event()
+        ss.pause_event.set()
     ss.setdefault("stop_event", threading.Event())
-    # pause_event semantics: set() means RUNNING; clear() means PAUSED
-    ss.pause_event.set()
 
 _init_state()
+def worker_alive() -> bool:
+    # The dispatcher outlives is_running after stop() while in-flight rows drain
+    thread = st.session_state.thread
+    return thread is not None and thread.is_alive()
+
+def worker_version():
+    ss = st.session_state
+    return (ss.log_version, ss.is_running, worker_alive())
+
+# Worker state this run renders; watch_worker() reruns the app once it moves on
+st.session_state.rendered_version = worker_version()
 
 # =========================
 # Helpers
 # =========================
-PROCESSED_FILE = "processed_profiles.json"
+PROCESSED_FILE = "processed_profiles.json"  # snapshot
+PROCESSED_LOG = "processed_profiles.log"  # append-only, one URL per line since the snapshot
+COMPACT_EVERY = 500  # successes between snapshot rewrites
+FLUSH_INTERVAL = 0.5  # seconds the flusher waits to batch queued URLs
+
+def write_processed_snapshot(profiles: list):
+    # Atomically swap in a full snapshot of the processed set
+    tmp_file = PROCESSED_FILE + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(orjson.dumps(profiles))
+    os.replace(tmp_file, PROCESSED_FILE)
+
+@st.cache_resource
+def get_processed_log():
+    # Opened once per server process. Workers only enqueue work: a URL (str) to append,
+    # or a snapshot (list) to compact into. A daemon flusher does all the disk I/O in
+    # queue order, so no caller ever writes while holding ss.lock.
+    f = open(PROCESSED_LOG, "a")
+    pending = queue.Queue()
+
+    def write_lines(lines):
+        if lines:
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+
+    def flusher():
+        while True:
+            items = [pending.get()]
+            time.sleep(FLUSH_INTERVAL)  # let a batch accumulate
+            while True:
+                try:
+                    items.append(pending.get_nowait())
+                except queue.Empty:
+                    break
+            lines = []
+            for item in items:
+                try:
+                    if isinstance(item, list):
+                        # URLs queued before the snapshot are in it; drop the log they
+                        # were written to, and keep only what comes after
+                        write_lines(lines)
+                        lines = []
+                        write_processed_snapshot(item)
+                        f.truncate(0)
+                    else:
+                        lines.append(item)
+                except Exception:
+                    pass
+            try:
+                write_lines(lines)
+            except Exception:
+                pass
+            for _ in items:
+                pending.task_done()
+
+    threading.Thread(target=flusher, daemon=True).start()
+    return f, pending
 
 def load_processed_profiles_from_disk():
+    profiles = set()
     try:
-        with open(PROCESSED_FILE, "r") as f:
-            return set(json.load(f))
+        with open(PROCESSED_FILE, "rb") as f:
+            profiles.update(orjson.loads(f.read()))
     except FileNotFoundError:
-        return set()
+        pass
     except Exception:
-        return set()
-
-def save_processed_profiles_to_disk(s: set):
+        pass
+    # Replay successes recorded after the last snapshot
     try:
-        with open(PROCESSED_FILE, "w") as f:
-            json.dump(list(s), f)
+        with open(PROCESSED_LOG, "r") as f:
+            profiles.update(line.rstrip("\n") for line in f if line.strip())
+    except FileNotFoundError:
+        pass
     except Exception:
         pass
+    return profiles
+
+def append_processed_profile_to_disk(profile_url: str):
+    # Non-blocking; the flusher thread does the write
+    _, pending = get_processed_log()
+    pending.put(profile_url)
+
+def request_processed_snapshot(profiles: list):
+    # Non-blocking; the flusher writes the snapshot and truncates the log
+    _, pending = get_processed_log()
+    pending.put(profiles)
+
+def flush_processed_log():
+    # Block until every queued URL and snapshot has been written
+    _, pending = get_processed_log()
+    pending.join()
+
+def compact_processed_profiles():
+    ss = st.session_state
+    with ss.lock:
+        # Enqueue under the lock so no URL missing from the snapshot is queued ahead of it
+        request_processed_snapshot(list(ss.processed_profiles))
+        ss.uncompacted_profiles = 0
+    flush_processed_log()
 
 def is_within_working_hours(now: datetime) -> bool:
     # Monday (0) .. Friday (4)
@@ -99,23 +215,66 @@ def is_within_working_hours(now: datetime) -> bool:
         return False
     return start_hour <= now.hour < end_hour
 
-def launch_phantom(api_key: str, agent_id: str, profile_url: str, message: str):
-    url = f"https://api.phantombuster.com/api/v2/agents/{agent_id}/launch"
-    headers = {
-        "Content-Type": "application/json",
-        "X-Phantombuster-Key-1": api_key,
-    }
+WAIT_REFRESH_SECS = 600  # how often an off-hours WAIT row refreshes its countdown
+
+def secs_until_next_window(now: datetime, open_hour: int, close_hour: int):
+    # Next Mon–Fri opening at open_hour: later today, else the next weekday.
+    # None if open_hour >= close_hour, since that window never opens.
+    if open_hour >= close_hour:
+        return None
+    opening = now.replace(hour=open_hour, minute=0, second=0, microsecond=0)
+    if opening <= now:
+        opening += timedelta(days=1)
+    while opening.weekday() >= 5:
+        opening += timedelta(days=1)
+    return (opening - now).total_seconds()
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    # One pooled keep-alive session per server process, so launches reuse TLS connections
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json"})
+    # A launch is not idempotent: after a read timeout or 5xx the agent may already be
+    # running, and a retry would send a second message. Only connect errors (request
+    # never sent) are retried, with a short backoff. Any error status, 429 included,
+    # is reported as an ERROR row; Retry-After is ignored because urllib3 would sleep
+    # for it inside a pool thread, holding a launch slot and ignoring Stop.
+    retry = Retry(
+        total=3,
+        connect=3,
+        read=0,
+        status=0,
+        backoff_factor=0.5,
+        status_forcelist=None,
+        allowed_methods=frozenset({"POST"}),
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=retry))
+    return session
+
+LAUNCH_URL_TMPL = "https://api.phantombuster.com/api/v2/agents/{agent_id}/launch"
+BASE_ARGUMENTS = {
+    "maxRequestsPerDay": 20,
+    "randomizeDelay": True,
+}
+
+def launch_headers(api_key: str) -> dict:
+    # The HTTP session is shared across users, so the API key travels per request
+    return {"X-Phantombuster-Key-1": api_key}
+
+def launch_phantom(url: str, headers: dict, profile_url: str, message: str, launch_delay: int):
+    # url/headers are built once per run in start(); only the arguments vary per profile
     payload = {
         "arguments": {
+            **BASE_ARGUMENTS,
             "specificProfileUrl": profile_url,
             "message": message,
-            "delay": random.randint(3, 8),
-            "maxRequestsPerDay": 20,
-            "randomizeDelay": True,
+            "delay": launch_delay,
         }
     }
     try:
-        resp = requests.post(url, headers=headers, json=payload, timeout=30)
+        resp = get_http_session().post(url, headers=headers, json=payload, timeout=30)
         if resp.status_code == 200:
             return {"ok": True, "data": resp.json()}
         return {"ok": False, "error": f"API Error: {resp.status_code} - {resp.text}"}
@@ -125,6 +284,47 @@ def launch_phantom(api_key: str, agent_id: str, profile_url: str, message: str):
 def add_log(row: dict):
     with st.session_state.lock:
         st.session_state.logs.append(row)
+        st.session_state.log_count += 1
+        st.session_state.log_version += 1
+
+def add_or_update_wait_log(row: dict):
+    # Consecutive WAIT entries collapse into one row that is refreshed in place
+    ss = st.session_state
+    with ss.lock:
+        if ss.logs and ss.logs[-1]["status"] == "WAIT":
+            ss.logs[-1] = row
+            ss.logs_df_stale = True
+        else:
+            ss.logs.append(row)
+            ss.log_count += 1
+        ss.log_version += 1
+
+LIVE_LOG_COLUMNS = ["time", "status", "profileUrl"]
+
+def get_logs_df():
+    # Append only the rows logged since the last render instead of rebuilding the frame
+    ss = st.session_state
+    with ss.lock:
+        if ss.logs_df_stale:
+            # A row was updated in place; rebuild from the bounded deque
+            ss.logs_df = None
+            ss.logs_df_count = ss.log_count - len(ss.logs)
+            ss.logs_df_stale = False
+        n_new = min(ss.log_count - ss.logs_df_count, len(ss.logs))
+        new_rows = list(islice(reversed(ss.logs), n_new))[::-1]
+        ss.logs_df_count = ss.log_count
+    if new_rows:
+        new_df = pd.DataFrame(new_rows)
+        if ss.logs_df is not None:
+            new_df = pd.concat([ss.logs_df, new_df], ignore_index=True)
+        ss.logs_df = new_df.tail(LOG_HISTORY)
+    return ss.logs_df
+
+@st.cache_data(max_entries=8)
+def parse_csv(data: bytes) -> pd.DataFrame:
+    # Cached by content, so reruns don't re-parse the same upload; bounded because the
+    # cache is shared by every session on the server. Each call returns a fresh copy.
+    return pd.read_csv(BytesIO(data))
 
 def compute_eta():
     ss = st.session_state
@@ -152,7 +352,7 @@ uploaded_file = st.file_uploader(" Upload CSV with columns: profileUrl, message"
 
 if uploaded_file:
     try:
-        df = pd.read_csv(uploaded_file)
+        df = parse_csv(uploaded_file.getvalue())
     except Exception as e:
         st.error(f"Could not read CSV: {e}")
         df = None
@@ -162,7 +362,7 @@ if uploaded_file:
         if missing:
             st.error(f"CSV is missing required columns: {missing}")
         else:
-            st.session_state.df = df.copy()
+            st.session_state.df = df
             st.success(f"Loaded {len(df)} rows.")
             st.dataframe(df.head(10), use_container_width=True)
 
@@ -188,13 +388,31 @@ def start():
     if ss.is_running:
         st.info("Already running.")
         return
+    if ss.thread is not None and ss.thread.is_alive():
+        st.info("The previous run is still finishing its in-flight rows. Try again shortly.")
+        return
 
     # Prepare queue
     df = ss.df
-    unprocessed_df = df[~df["profileUrl"].isin(ss.processed_profiles)]
-    ss.total = len(unprocessed_df)
+    # Single pass: O(1) set lookups filter straight into plain (profileUrl, message)
+    # tuples, which also keeps pandas out of the worker loop. Only the first row per
+    # URL is kept: with several launch slots a later copy would be dispatched while
+    # the first is still in flight.
+    processed = ss.processed_profiles
+    seen = set()
+    work_items = []
+    for profile_url, message in zip(df["profileUrl"].astype(str), df["message"].astype(str)):
+        if profile_url in processed or profile_url in seen:
+            continue
+        seen.add(profile_url)
+        work_items.append((profile_url, message))
+    ss.total = len(work_items)
     ss.completed = 0
-    ss.logs = []
+    ss.logs = deque(maxlen=LOG_HISTORY)
+    ss.log_count = 0
+    ss.logs_df = None
+    ss.logs_df_count = 0
+    ss.logs_df_stale = False
     ss.is_stopped = False
     ss.stop_event.clear()
     ss.pause_event.set()  # start in running state
@@ -202,45 +420,36 @@ def start():
     ss.is_running = True
     ss.start_time = time.time()
     ss.avg_secs = None
-
-    # Start worker thread
-    def worker(rows):
-        for _, row in rows.iterrows():
-            if ss.stop_event.is_set():
-                break
-
-            # Pause handling
-            while not ss.pause_event.is_set():
-                time.sleep(0.2)
-                if ss.stop_event.is_set():
-                    break
-            if ss.stop_event.is_set():
-                break
-
-            # Working hours check
-            now = datetime.now()
-            if not is_within_working_hours(now):
-                add_log({
-                    "time": now.isoformat(timespec="seconds"),
-                    "profileUrl": None,
-                    "status": "WAIT",
-                    "details": "Outside working hours. Sleeping 1 hour.",
-                    "elapsed_sec": None,
-                })
-                # sleep in small chunks to remain responsive to stop/pause
-                for _ in range(60 * 60 // 2):  # 1 hour in 0.5s steps
-                    if ss.stop_event.is_set():
-                        break
-                    while not ss.pause_event.is_set():
-                        time.sleep(0.2)
-                        if ss.stop_event.is_set():
-                            break
-                    time.sleep(0.5)
-                if ss.stop_event.is_set():
-                    break
-
-            profile_url = str(row["profileUrl"])
-            message = str(row["message"])
+    ss.elapsed_sum = 0.0
+    ss.elapsed_count = 0
+
+    # Everything below is per run and captured by worker/process_row rather than
+    # read back through ss, so a later start() can never swap it under old rows
+    launch_url = LAUNCH_URL_TMPL.format(agent_id=agent_id)
+    headers = launch_headers(api_key)
+
+    # Pre-sample per-row randomness in one batch from a private generator, so pool
+    # threads index into plain lists instead of sharing the global Random
+    rng = random.Random()
+    delay_buffer = []  # (inter-row delay, is extended break)
+    for _ in range(ss.total):
+        delay = rng.uniform(min_delay, max_delay)
+        extended = rng.random() < (extended_break_chance / 100.0)
+        if extended:
+            delay += rng.uniform(extended_break_min, extended_break_max)
+        delay_buffer.append((delay, extended))
+    launch_delays = [rng.randint(3, 8) for _ in range(ss.total)]
+
+    # Each row runs launch + per-row delay on the pool; slots caps in-flight rows.
+    # Threads rather than an asyncio loop: the pooled requests session already gives
+    # keep-alive and retries, and every wait (pause, stop, delay, working hours) blocks
+    # on an Event, so the worker has no polling left for an event loop to remove.
+    executor = ThreadPoolExecutor(max_workers=int(max_workers), thread_name_prefix="outreach")
+    slots = threading.BoundedSemaphore(int(max_workers))
+
+    def process_row(i, profile_url, message):
+        counted = False
+        try:
             started = time.time()
             add_log({
                 "time": datetime.now().isoformat(timespec="seconds"),
@@ -250,7 +459,7 @@ def start():
                 "elapsed_sec": None,
             })
 
-            res = launch_phantom(api_key, agent_id, profile_url, message)
+            res = launch_phantom(launch_url, headers, profile_url, message, launch_delays[i])
             elapsed = time.time() - started
 
             if res["ok"]:
@@ -264,7 +473,12 @@ def start():
                 })
                 with ss.lock:
                     ss.processed_profiles.add(profile_url)
-                    save_processed_profiles_to_disk(ss.processed_profiles)
+                    append_processed_profile_to_disk(profile_url)
+                    ss.uncompacted_profiles += 1
+                    if ss.uncompacted_profiles >= COMPACT_EVERY:
+                        # Copy under the lock; the flusher does the disk I/O
+                        request_processed_snapshot(list(ss.processed_profiles))
+                        ss.uncompacted_profiles = 0
             else:
                 add_log({
                     "time": datetime.now().isoformat(timespec="seconds"),
@@ -277,15 +491,15 @@ def start():
             # Update counters and avg
             with ss.lock:
                 ss.completed += 1
-                # compute rolling average time per profile
-                finished = [r for r in ss.logs if r["status"] in ("SUCCESS", "ERROR") and r["elapsed_sec"] is not None]
-                if finished:
-                    ss.avg_secs = sum(r["elapsed_sec"] for r in finished) / len(finished)
+                # running average time per profile, O(1) per completion
+                ss.elapsed_sum += round(elapsed, 2)
+                ss.elapsed_count += 1
+                ss.avg_secs = ss.elapsed_sum / ss.elapsed_count
+            counted = True
 
             # Delay simulation w/ occasional extended break
-            delay = random.uniform(min_delay, max_delay)
-            if random.random() < (extended_break_chance / 100.0):
-                delay += random.uniform(extended_break_min, extended_break_max)
+            delay, extended = delay_buffer[i]
+            if extended:
                 add_log({
                     "time": datetime.now().isoformat(timespec="seconds"),
                     "profileUrl": None,
@@ -294,27 +508,96 @@ def start():
                     "elapsed_sec": None,
                 })
 
-            # Sleep in small chunks so pause/stop stays responsive
-            slept = 0.0
-            step = 0.25
-            while slept < delay:
+            # Block until the delay elapses or stop() is called, whichever comes first
+            ss.stop_event.wait(timeout=delay)
+        except Exception as e:
+            # Futures are never inspected, so surface the failure here
+            logging.exception("Outreach row failed: %s", profile_url)
+            add_log({
+                "time": datetime.now().isoformat(timespec="seconds"),
+                "profileUrl": profile_url,
+                "status": "ERROR",
+                "details": f"Unexpected error: {e}",
+                "elapsed_sec": None,
+            })
+            if not counted:
+                with ss.lock:
+                    ss.completed += 1
+        finally:
+            slots.release()
+
+    # Dispatcher thread: handles pause/stop/working hours and feeds the pool
+    def worker(items):
+        for i, (profile_url, message) in enumerate(items):
+            if ss.stop_event.is_set():
+                break
+
+            # Cheap guard: skip a URL that entered processed_profiles after start() built the queue
+            with ss.lock:
+                already_processed = profile_url in ss.processed_profiles
+                if already_processed:
+                    ss.completed += 1
+            if already_processed:
+                add_log({
+                    "time": datetime.now().isoformat(timespec="seconds"),
+                    "profileUrl": profile_url,
+                    "status": "SKIP",
+                    "details": "Already processed.",
+                    "elapsed_sec": None,
+                })
+                continue
+
+            # Wait for a free launch slot. The previous row holds it through its delay,
+            # so the pause and working-hours checks below run after that delay, right
+            # before launch, as they did when the worker slept inline
+            slots.acquire()
+
+            # Pause, stop and working hours must all pass at the same moment, so loop
+            # until they do: a pause that outlasts the window, or a pause made during an
+            # off-hours wait, gets re-checked instead of launching straight through.
+            # stop() sets pause_event to release a paused wait; the slot stays held.
+            while True:
+                if not ss.pause_event.is_set():
+                    ss.pause_event.wait()
                 if ss.stop_event.is_set():
                     break
-                while not ss.pause_event.is_set():
-                    time.sleep(0.2)
-                    if ss.stop_event.is_set():
-                        break
-                if ss.stop_event.is_set():
+                now = datetime.now()
+                if is_within_working_hours(now):
                     break
-                time.sleep(step)
-                slept += step
+                wait_secs = secs_until_next_window(now, start_hour, end_hour)
+                if wait_secs is None:
+                    add_log({
+                        "time": now.isoformat(timespec="seconds"),
+                        "profileUrl": None,
+                        "status": "ERROR",
+                        "details": "Start hour must be before end hour; working hours never open.",
+                        "elapsed_sec": None,
+                    })
+                    ss.stop_event.set()
+                    break
+                resume_at = now + timedelta(seconds=wait_secs)
+                add_or_update_wait_log({
+                    "time": now.isoformat(timespec="seconds"),
+                    "profileUrl": None,
+                    "status": "WAIT",
+                    "details": f"Outside working hours. Resuming at {resume_at:%a %H:%M} (in {secs_to_hms(int(wait_secs))}).",
+                    "elapsed_sec": None,
+                })
+                # Wake on a coarse interval to refresh the countdown above and re-check
+                # pause; returns immediately once stop() is called
+                ss.stop_event.wait(timeout=min(wait_secs, WAIT_REFRESH_SECS))
             if ss.stop_event.is_set():
+                slots.release()
                 break
 
-        # mark finished
+            executor.submit(process_row, i, profile_url, message)
+
+        # mark finished once in-flight rows have drained
+        executor.shutdown(wait=True)
+        compact_processed_profiles()
         ss.is_running = False
 
-    st.session_state.thread = threading.Thread(target=worker, args=(unprocessed_df,), daemon=True)
+    st.session_state.thread = threading.Thread(target=worker, args=(work_items,), daemon=True)
     st.session_state.thread.start()
 
 def pause():
@@ -337,6 +620,7 @@ def stop():
         ss.pause_event.set()
         ss.is_paused = False
         ss.is_running = False
+        compact_processed_profiles()
 
 with c1:
     st.button("▶ Start", use_container_width=True, on_click=start)
@@ -368,9 +652,16 @@ status = "Running" if st.session_state.is_running and not st.session_state.is_pa
          "Stopped" if st.session_state.is_stopped else "Idle"
 st.info(f"Status: **{status}**")
 
-# Auto-refresh the dashboard while running or paused so the table updates live
-if st.session_state.is_running or st.session_state.is_paused:
-    st_autorefresh(interval=5000, key="auto_refresh")
+# Poll cheaply in a fragment and rerun the whole page only when the worker logged
+# something or finished, instead of a timed full rerun
+@st.fragment(run_every=1.5)
+def watch_worker():
+    if worker_version() != st.session_state.rendered_version:
+        st.rerun()
+
+# Stay mounted until the dispatcher exits, so rows finishing after Stop still show up
+if st.session_state.is_running or st.session_state.is_paused or worker_alive():
+    watch_worker()
 
 
 # =========================
@@ -378,9 +669,12 @@ if st.session_state.is_running or st.session_state.is_paused:
 # =========================
 st.subheader("4) Real-Time Logs")
 if st.session_state.logs:
-    df_logs = pd.DataFrame(st.session_state.logs)
-    # Keep last 500 rows in view for speed
-    st.dataframe(df_logs.tail(500), use_container_width=True, height=360)
+    df_logs = get_logs_df()
+    # Keep last 500 rows and only the hot columns in view for speed;
+    # details and elapsed_sec stay in the CSV export
+    view_df = df_logs.tail(500)[LIVE_LOG_COLUMNS]
+    st.dataframe(view_df, use_container_width=True, height=360)
+    st.caption("Full details (container IDs, errors, timings) are in the CSV export below.")
 else:
     st.caption("No logs yet. Click Start to begin.")
 
@@ -392,9 +686,12 @@ def download_logs_button():
     if not st.session_state.logs:
         st.warning("No logs to download yet.")
         return
-    df_logs = pd.DataFrame(st.session_state.logs)
+    with st.session_state.lock:
+        rows = list(st.session_state.logs)
+    # One writer for every size, so the file format never depends on the row count;
+    # the deque caps the export at LOG_HISTORY rows, which pandas handles quickly
     csv_buf = StringIO()
-    df_logs.to_csv(csv_buf, index=False)
+    pd.DataFrame(rows).to_csv(csv_buf, index=False)
     st.download_button(
         " Download Logs (CSV)",
         data=csv_buf.getvalue(),
@@ -405,4 +702,4 @@ def download_logs_button():
 
 download_logs_button()
 
-st.caption("Processed profile URLs are also persisted in `processed_profiles.json` to avoid duplicates across reruns in the same app instance.")
+st.caption("Processed profile URLs are also persisted in `processed_profiles.json` (plus the append-only `processed_profiles.log`) to avoid duplicates across reruns in the same app instance.")